@@ -0,0 +1,79 @@
+/*
+ * SIMD int16 -> float32 conversion for the ASR hot path.
+ *
+ * Build (see `make build-asr-ext`):
+ *   cc -O3 -shared -fPIC -o _pcm_ext.so _pcm_ext.c
+ *
+ * The AVX2 path is selected at runtime via __builtin_cpu_supports, so one
+ * binary runs on any x86-64 host (scalar fallback included); aarch64 always
+ * has NEON. core/_kernels.py loads this via ctypes when the .so sits next to
+ * it and falls back to the Numba/NumPy paths otherwise, so the extension is
+ * strictly optional. NumPy arrays are passed as raw pointers (buffer
+ * protocol), no copies involved.
+ */
+#include <stddef.h>
+#include <stdint.h>
+
+#if defined(__x86_64__) || defined(_M_X64)
+#define VOXA_X86 1
+#include <immintrin.h>
+#elif defined(__ARM_NEON)
+#include <arm_neon.h>
+#endif
+
+static const float kInvInt16 = 1.0f / 32768.0f;
+
+static void pcm16_to_f32_scalar(const int16_t *src, float *dst, size_t n)
+{
+    for (size_t i = 0; i < n; ++i)
+        dst[i] = (float)src[i] * kInvInt16;
+}
+
+#ifdef VOXA_X86
+/* 16 samples per iteration: sign-extend each int16 half to int32, convert
+ * to float and multiply by the reciprocal of full scale. */
+__attribute__((target("avx2")))
+static void pcm16_to_f32_avx2(const int16_t *src, float *dst, size_t n)
+{
+    const __m256 inv = _mm256_set1_ps(kInvInt16);
+    size_t i = 0;
+    for (; i + 16 <= n; i += 16) {
+        __m256i s = _mm256_loadu_si256((const __m256i *)(src + i));
+        __m256i lo = _mm256_cvtepi16_epi32(_mm256_castsi256_si128(s));
+        __m256i hi = _mm256_cvtepi16_epi32(_mm256_extracti128_si256(s, 1));
+        _mm256_storeu_ps(dst + i, _mm256_mul_ps(_mm256_cvtepi32_ps(lo), inv));
+        _mm256_storeu_ps(dst + i + 8, _mm256_mul_ps(_mm256_cvtepi32_ps(hi), inv));
+    }
+    pcm16_to_f32_scalar(src + i, dst + i, n - i);
+}
+#elif defined(__ARM_NEON)
+/* 8 samples per iteration via widen + convert + multiply. */
+static void pcm16_to_f32_neon(const int16_t *src, float *dst, size_t n)
+{
+    const float32x4_t inv = vdupq_n_f32(kInvInt16);
+    size_t i = 0;
+    for (; i + 8 <= n; i += 8) {
+        int16x8_t s = vld1q_s16(src + i);
+        float32x4_t lo = vcvtq_f32_s32(vmovl_s16(vget_low_s16(s)));
+        float32x4_t hi = vcvtq_f32_s32(vmovl_s16(vget_high_s16(s)));
+        vst1q_f32(dst + i, vmulq_f32(lo, inv));
+        vst1q_f32(dst + i + 4, vmulq_f32(hi, inv));
+    }
+    pcm16_to_f32_scalar(src + i, dst + i, n - i);
+}
+#endif
+
+/* Scale n int16 samples into float32 in [-1, 1). */
+void pcm16_to_f32(const int16_t *src, float *dst, size_t n)
+{
+#ifdef VOXA_X86
+    if (__builtin_cpu_supports("avx2")) {
+        pcm16_to_f32_avx2(src, dst, n);
+        return;
+    }
+#elif defined(__ARM_NEON)
+    pcm16_to_f32_neon(src, dst, n);
+    return;
+#endif
+    pcm16_to_f32_scalar(src, dst, n);
+}
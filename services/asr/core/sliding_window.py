@@ -1,8 +1,14 @@
 """Sliding window for audio. PCM16 mono."""
-from collections import deque
+import functools
 from typing import Optional
+
 import numpy as np
 
+from ._kernels import f32_to_bf16, i16_to_f32, i16_two_to_f32
+
+# Converts the default 1/32768 scaling to symmetric 1/32767 in-place.
+_SYM_GAIN = np.float32(32768.0 / 32767.0)
+
 
 class AudioSlidingWindow:
     """
@@ -17,9 +23,11 @@ class AudioSlidingWindow:
 
     Design choices
     --------------
-    - Internally stores **int16 samples** (not bytes) for easy slicing.
-    - Keeps memory bounded via a `deque(maxlen=...)`. When the buffer is full,
-      pushing new samples automatically drops the oldest ones.
+    - Internally stores **int16 samples** in a pre-allocated NumPy ring buffer.
+      Appends are one or two slice assignments (no per-sample Python objects),
+      and reads come back as contiguous arrays without rebuilding from scratch.
+    - Memory is bounded by construction: the ring holds exactly `max_samples`
+      samples, so pushing past capacity overwrites the oldest ones in place.
     - Mono-only
 
     Typical use
@@ -36,6 +44,32 @@ class AudioSlidingWindow:
       only when needed.
     """
 
+    # One window per live stream on multi-session hosts: slots drop the
+    # per-instance __dict__ and make the hot-path attribute reads in
+    # append/_last C-level slot lookups. `append` stays a plain method —
+    # specialization swaps `_append_impl`, which is a slot, not the method.
+    __slots__ = (
+        "window_size_ms",
+        "sample_rate_hz",
+        "default_tail_ms",
+        "track_float",
+        "symmetric_float",
+        "max_samples",
+        "_capacity",
+        "_mask",
+        "_buf",
+        "_unwrap",
+        "_f32_scratch",
+        "_fbuf",
+        "_write",
+        "_filled",
+        "_append_impl",
+        "_seen_size",
+        "_seen_count",
+        "_total_samples",
+        "_spms",
+    )
+
     # Public config knobs
     window_size_ms: int
     sample_rate_hz: int
@@ -43,44 +77,119 @@ class AudioSlidingWindow:
 
     # Derived / internal state
     max_samples: int                 # how many **samples** fit in the window
-    buffer: deque[int]               # stores individual int16 samples
+    _capacity: int                   # physical ring size (max_samples rounded up to a power of two)
+    _mask: int                       # _capacity - 1, for bitmask wrap arithmetic
+    _buf: np.ndarray                 # pre-allocated int16 ring buffer
+    _unwrap: np.ndarray              # scratch for contiguous reads when wrapped
+    _f32_scratch: np.ndarray         # reused output buffer for float32 exports
+    _write: int                      # next physical write index into `_buf`
+    _filled: int                     # samples currently held (<= max_samples)
+    _seen_size: int                  # last frame size, for append specialization
+    _seen_count: int                 # how many consecutive frames had that size
     _total_samples: int              # ever-seen sample counter (monotonic)
+    _spms: int                       # samples per millisecond (sample_rate_hz // 1000)
+
+    def __new__(
+        cls,
+        window_size_ms: int,
+        sample_rate_hz: int = 16000,
+        default_tail_ms: int = 2000,
+        *,
+        track_float: bool = False,
+        symmetric_float: bool = False,
+    ) -> "AudioSlidingWindow":
+        # Power-of-two sample rates (16/32 kHz — i.e. nearly every ASR
+        # stream) get a subclass where the ms<->samples math is a shift;
+        # see `_make_window_class`. Explicit subclasses are left alone.
+        if cls is AudioSlidingWindow and sample_rate_hz % 1000 == 0:
+            spms = sample_rate_hz // 1000
+            if spms > 0 and spms & (spms - 1) == 0:
+                cls = _make_window_class(spms)
+        return object.__new__(cls)
 
     def __init__(
         self,
         window_size_ms: int,
         sample_rate_hz: int = 16000,
         default_tail_ms: int = 2000,
+        *,
+        track_float: bool = False,
+        symmetric_float: bool = False,
     ) -> None:
         assert window_size_ms > 0, "window_size_ms must be > 0"
         assert sample_rate_hz > 0, "sample_rate_hz must be > 0"
+        assert sample_rate_hz % 1000 == 0, "sample_rate_hz must be a multiple of 1000"
 
         self.window_size_ms = int(window_size_ms)
         self.sample_rate_hz = int(sample_rate_hz)
         self.default_tail_ms = min(default_tail_ms, window_size_ms)
+        self.track_float = bool(track_float)
+        # Symmetric scaling (JUCE/Oboe convention): divide by 32767 so +32767
+        # maps to exactly +1.0, saturating the one asymmetric code (-32768)
+        # branchlessly. Default keeps the classic 1/32768 mapping the tests
+        # encode.
+        self.symmetric_float = bool(symmetric_float)
+
+        # Samples per millisecond (16 at 16 kHz); hoists the (sr * ms) // 1000
+        # divide out of every hot-path conversion.
+        self._spms = self.sample_rate_hz // 1000
 
         # Max number of **mono** samples we keep at any time.
-        # Example: 16_000 Hz * 3000 ms / 1000 = 48_000 samples (~96 KB @ int16)
-        self.max_samples = (self.sample_rate_hz * self.window_size_ms) // 1000
+        # Example: 16 samples/ms * 3000 ms = 48_000 samples (~96 KB @ int16)
+        self.max_samples = self._spms * self.window_size_ms
+
+        # Physical ring capacity is `max_samples` rounded up to a power of
+        # two so wrap arithmetic is a single AND against `_mask` instead of a
+        # div/mod. `max_samples` stays the logical window size for eviction
+        # and metrics.
+        self._capacity = 1 << (self.max_samples - 1).bit_length()
+        self._mask = self._capacity - 1
+
+        # Pre-allocated ring buffer plus a scratch buffer used to hand out
+        # contiguous arrays once the ring has wrapped. Both live at a fixed
+        # address for the lifetime of the window — no per-append allocation,
+        # no per-read rebuild.
+        self._buf = np.empty(self._capacity, dtype=np.int16)
+        self._unwrap = np.empty(self.max_samples, dtype=np.int16)
+        self._write = 0
+        self._filled = 0
+
+        # Scratch for float32 exports, reused across reads (see `_export_f32`).
+        self._f32_scratch = np.empty(self.max_samples, dtype=np.float32)
 
-        # Bounded buffer of **individual int16 samples**. As you append past
-        # capacity, the deque automatically discards the oldest samples.
-        self.buffer = deque(maxlen=self.max_samples)
+        # Opt-in SoA mirror: a float32 ring kept in lockstep with `_buf` by
+        # append, so float reads are slices/copies instead of reconversions.
+        # Appends already touch every sample, which amortizes the scaling.
+        self._fbuf = np.empty(self._capacity, dtype=np.float32) if self.track_float else None
+
+        # Append specialization: once the caller has pushed enough frames of
+        # one identical size (the normal case — fixed 20/40 ms frames), swap
+        # in a closure with that size and the ring constants bound as locals.
+        self._append_impl = self._append_general
+        self._seen_size = -1
+        self._seen_count = 0
 
         # Metrics / cadence counters
         self._total_samples = 0
-        self._since_last_partial = 0
 
     # ---------------------------------------------------------------------
     # Append & Read APIs
     # ---------------------------------------------------------------------
-    def append(self, pcm16_le: bytes) -> int:
+    # After this many identically sized frames, `append` specializes itself.
+    _SPECIALIZE_AFTER = 32
+    # At or below this many bytes, np.frombuffer's fixed overhead dominates
+    # and a plain memoryview cast feeds the slice assignment instead.
+    _SMALL_FRAME_BYTES = 2048
+
+    def append(self, pcm16_le: "bytes | bytearray | memoryview | np.ndarray") -> int:
         """Append a PCM16 **little-endian** mono frame.
 
         Parameters
         ----------
-        pcm16_le : bytes
-            Raw PCM16 little-endian audio (2 bytes per sample, mono).
+        pcm16_le : bytes | bytearray | memoryview | np.ndarray
+            Raw PCM16 little-endian audio (2 bytes per sample, mono), or an
+            int16 array from an upstream decoder — passing the array directly
+            skips the tobytes()/frombuffer round-trip it would otherwise pay.
 
         Returns
         -------
@@ -89,62 +198,299 @@ class AudioSlidingWindow:
 
         Notes
         -----
-        - We convert the bytes to a NumPy int16 array, then extend the deque
-          with Python ints. This makes eviction by `maxlen` automatic.
-        - If you ever need maximum throughput, consider a NumPy ring buffer
-          instead of a deque to avoid Python-level per-element overhead.
+        - The bytes are reinterpreted as int16 (zero-copy) and written into the
+          ring with at most two slice assignments — one when the frame fits
+          before the wrap point, two when it straddles it. No Python-level
+          per-sample loop is involved.
+        - Streams usually push frames of one fixed size; after
+          `_SPECIALIZE_AFTER` identical sizes the general path is swapped for
+          a closure specialized to that size (see `_make_append_fixed`).
         """
-        # `np.int16` is little-endian on little-endian CPUs; if you want to be
-        # explicit about endianness, use `np.dtype('<i2')` instead.
-        arr = np.frombuffer(pcm16_le, dtype=np.int16)
-        self.buffer.extend(arr.tolist())  # push individual samples
-        n = int(arr.size)
+        return self._append_impl(pcm16_le)
+
+    def _append_general(self, pcm16_le) -> int:
+        """General append path; also tracks frame sizes for specialization."""
+        if isinstance(pcm16_le, np.ndarray):
+            # Already an array: use it as-is when it is contiguous int16,
+            # normalize (one copy) otherwise.
+            arr = pcm16_le
+            if arr.dtype != np.int16 or not arr.flags.c_contiguous:
+                arr = np.ascontiguousarray(arr, dtype=np.int16)
+            n = int(arr.size)
+        elif len(pcm16_le) <= self._SMALL_FRAME_BYTES and self._fbuf is None:
+            # Tiny frames (10-20 ms): skip the NumPy array object entirely —
+            # the slice assignment from a memoryview is a single C-level
+            # memcpy. cast('h') is native order, i.e. little-endian on every
+            # host we deploy to.
+            arr = memoryview(pcm16_le).cast("h")
+            n = len(arr)
+        else:
+            # `<i2` is explicit little-endian int16 so the reinterpret is
+            # correct regardless of host byte order.
+            arr = np.frombuffer(pcm16_le, dtype="<i2")
+            n = int(arr.size)
+        if n == self._seen_size:
+            self._seen_count += 1
+            if self._seen_count >= self._SPECIALIZE_AFTER and 0 < n < self.max_samples:
+                self._append_impl = self._make_append_fixed(n)
+        else:
+            self._seen_size = n
+            self._seen_count = 1
+        return self._append_samples(arr, n)
+
+    def _append_samples(self, arr: np.ndarray, n: int) -> int:
         self._total_samples += n
+        if n == 0:
+            return 0
+
+        fbuf = self._fbuf
+        if n >= self.max_samples:
+            # Frame alone overflows the window: only the newest samples survive.
+            self._buf[: self.max_samples] = arr[-self.max_samples:]
+            if fbuf is not None:
+                i16_to_f32(arr[-self.max_samples:], fbuf[: self.max_samples])
+                if self.symmetric_float:
+                    self._symmetrize(fbuf[: self.max_samples])
+            self._write = self.max_samples & self._mask
+            self._filled = self.max_samples
+            return n
+
+        end = self._write + n
+        if end <= self._capacity:
+            self._buf[self._write:end] = arr
+            if fbuf is not None:
+                i16_to_f32(arr, fbuf[self._write:end])
+                if self.symmetric_float:
+                    self._symmetrize(fbuf[self._write:end])
+            self._write = end & self._mask
+        else:
+            # Frame straddles the wrap point: split into two slices.
+            k = self._capacity - self._write
+            self._buf[self._write:] = arr[:k]
+            self._buf[: n - k] = arr[k:]
+            if fbuf is not None:
+                i16_to_f32(arr[:k], fbuf[self._write:])
+                i16_to_f32(arr[k:], fbuf[: n - k])
+                if self.symmetric_float:
+                    self._symmetrize(fbuf[self._write:])
+                    self._symmetrize(fbuf[: n - k])
+            self._write = n - k
+        self._filled = min(self.max_samples, self._filled + n)
         return n
 
-    def _as_float(self, x: np.ndarray, as_float: bool) -> np.ndarray:
-        """Convert int16 -> float32 in [-1, 1] if requested.
+    def _make_append_fixed(self, n: int):
+        """Build an append closure specialized to a fixed frame size.
 
-        This keeps the window memory-efficient (int16) while allowing callers
-        to get float32 only when the model needs it.
+        Frame size, ring constants and the buffer itself are bound as locals,
+        so the per-call work is one `frombuffer`, one branch and the slice
+        writes. If the frame size ever changes we fall back to the general
+        path (and may re-specialize later).
         """
-        if not as_float:
-            return x
-        # 32768.0 is the int16 full scale. Cast then scale to [-1, 1].
-        return x.astype(np.float32) / 32768.0
+        buf = self._buf
+        fbuf = self._fbuf
+        capacity = self._capacity
+        mask = self._mask
+        max_samples = self.max_samples
+        symmetric = self.symmetric_float
+        # Same small-frame shortcut as the general path (bound once here).
+        small = n * 2 <= self._SMALL_FRAME_BYTES and fbuf is None
+
+        def append_fixed(pcm16_le: bytes) -> int:
+            if small:
+                arr = memoryview(pcm16_le).cast("h")
+                size = len(arr)
+            else:
+                arr = np.frombuffer(pcm16_le, dtype="<i2")
+                size = arr.size
+            if size != n:
+                self._append_impl = self._append_general
+                self._seen_size = -1
+                self._seen_count = 0
+                return self._append_general(pcm16_le)
+            self._total_samples += n
+            w = self._write
+            end = w + n
+            if end <= capacity:
+                buf[w:end] = arr
+                if fbuf is not None:
+                    i16_to_f32(arr, fbuf[w:end])
+                    if symmetric:
+                        self._symmetrize(fbuf[w:end])
+                self._write = end & mask
+            else:
+                k = capacity - w
+                buf[w:] = arr[:k]
+                buf[: n - k] = arr[k:]
+                if fbuf is not None:
+                    i16_to_f32(arr[:k], fbuf[w:])
+                    i16_to_f32(arr[k:], fbuf[: n - k])
+                    if symmetric:
+                        self._symmetrize(fbuf[w:])
+                        self._symmetrize(fbuf[: n - k])
+                self._write = n - k
+            if self._filled != max_samples:
+                self._filled = min(max_samples, self._filled + n)
+            return n
+
+        return append_fixed
+
+    def _last(self, n: int) -> np.ndarray:
+        """Return the newest `n` samples (n <= `_filled`) as a contiguous array.
+
+        Fast path: when the region does not cross the physical wrap point this
+        is a zero-copy view into the ring. Otherwise the two halves are copied
+        into the pre-allocated `_unwrap` scratch (fixed address, no allocation).
 
-    def tail_ms(self, ms: Optional[int] = None, *, as_float: bool = False) -> np.ndarray:
+        Either way the result is marked read-only: it aliases window-owned
+        memory, so callers that need ownership must `.copy()` it.
+        """
+        start = self._write - n
+        if start >= 0:
+            out = self._buf[start:self._write]
+        else:
+            out = self._unwrap[:n]
+            head = -start  # samples sitting at the end of the physical buffer
+            np.copyto(out[:head], self._buf[self._capacity + start:])
+            np.copyto(out[head:], self._buf[: self._write])
+        out.flags.writeable = False
+        return out
+
+    def _last_f32(self, n: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Newest `n` samples from the float32 mirror (track_float only).
+
+        Same unwrap logic as `_last`, but over `_fbuf`: a zero-copy view when
+        contiguous, otherwise two copies into the float scratch (or `out`).
+        """
+        start = self._write - n
+        if start >= 0 and out is None:
+            view = self._fbuf[start:self._write]
+            view.flags.writeable = False  # aliases the mirror; copy to own
+            return view
+        dst = (self._f32_scratch if out is None else out)[:n]
+        if start >= 0:
+            np.copyto(dst, self._fbuf[start:self._write])
+        else:
+            head = -start
+            np.copyto(dst[:head], self._fbuf[self._capacity + start:])
+            np.copyto(dst[head:], self._fbuf[: self._write])
+        return dst
+
+    def _export_f32(self, n: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Newest `n` samples as float32 in [-1, 1], no int16 staging copy.
+
+        Fused unwrap+scale in one pass into a pre-allocated buffer: the
+        contiguous case is a single kernel call, the wrapped case scales both
+        ring halves directly into the output (see core/_kernels.py) instead
+        of unwrapping to int16 first. When `out` is given the samples land in
+        its leading slice, so a caller can keep one buffer at a fixed address
+        across reads (decoders like this). Without `out`, the returned slice
+        aliases `_f32_scratch` and is overwritten by the next float read —
+        callers (the Transcriber) consume it immediately.
+        """
+        dst = (self._f32_scratch if out is None else out)[:n]
+        start = self._write - n
+        if start >= 0:
+            i16_to_f32(self._buf[start:self._write], dst)
+        else:
+            i16_two_to_f32(
+                self._buf[self._capacity + start:], self._buf[: self._write], dst
+            )
+        if self.symmetric_float:
+            self._symmetrize(dst)
+        return dst
+
+    @staticmethod
+    def _symmetrize(dst: np.ndarray) -> None:
+        """Rescale 1/32768 output to 1/32767 and saturate, branchlessly.
+
+        Only -32768 actually clips; min/max map to single SIMD ops, no
+        data-dependent branches to mispredict.
+        """
+        np.multiply(dst, _SYM_GAIN, out=dst)
+        np.clip(dst, -1.0, 1.0, out=dst)
+
+    def tail_ms(
+        self,
+        ms: Optional[int] = None,
+        *,
+        as_float: bool = False,
+        out: Optional[np.ndarray] = None,
+        copy: bool = False,
+    ) -> np.ndarray:
         """Return the most recent `ms` of samples as a NumPy array.
 
         If `ms` is None, use `default_tail_ms`.
-        If `as_float` is True, return float32 in [-1, 1].
+        If `as_float` is True, return float32 in [-1, 1]; pass `out` to have
+        the float samples written into a caller-owned buffer.
+        Reads alias window-owned memory (the ring or a reused scratch) and are
+        invalidated by the next append/read; pass `copy=True` for a private,
+        writable array that outlives them.
         """
         if ms is None:
             ms = self.default_tail_ms
-        n_samples = max(0, (self.sample_rate_hz * int(ms)) // 1000)
+        n_samples = max(0, int(ms) * self._spms)
 
-        # Convert deque -> 1-D int16 array. This is a copy, which is fine for
-        # small PoC windows. For very large windows, prefer a ring buffer.
-        data = np.fromiter(self.buffer, dtype=np.int16, count=len(self.buffer))
-        if n_samples == 0 or n_samples >= data.size:
-            return self._as_float(data, as_float)
-        tail = data[-n_samples:]
-        return self._as_float(tail, as_float)
+        if n_samples == 0 or n_samples >= self._filled:
+            n_samples = self._filled
+        return self._read(n_samples, as_float, out, copy)
 
-    def full(self, *, as_float: bool = False) -> np.ndarray:
+    def full(
+        self,
+        *,
+        as_float: bool = False,
+        as_bf16: bool = False,
+        out: Optional[np.ndarray] = None,
+        copy: bool = False,
+    ) -> np.ndarray:
         """Return **all** samples currently in the window as a NumPy array.
 
-        If `as_float` is True, return float32 in [-1, 1].
+        If `as_float` is True, return float32 in [-1, 1]; pass `out` to have
+        the float samples written into a caller-owned buffer. `copy=True`
+        returns a private, writable array (see `tail_ms`).
+        `as_bf16=True` returns the float samples rounded to bfloat16 bit
+        patterns (uint16, caller-owned — half the bytes to move to a device);
+        see `core._kernels.f32_to_bf16`.
         """
-        data = np.fromiter(self.buffer, dtype=np.int16, count=len(self.buffer))
-        return self._as_float(data, as_float)
+        if as_bf16:
+            return f32_to_bf16(self._read(self._filled, True, None, False))
+        return self._read(self._filled, as_float, out, copy)
+
+    def _read(
+        self, n: int, as_float: bool, out: Optional[np.ndarray], copy: bool
+    ) -> np.ndarray:
+        """Shared dispatch for `tail_ms`/`full`: pick the backend, then copy
+        if the caller asked for ownership (`out` is already caller-owned)."""
+        if not as_float:
+            res = self._last(n)
+        elif self.track_float:
+            res = self._last_f32(n, out)
+        else:
+            res = self._export_f32(n, out)
+        if copy and out is None:
+            return res.copy()
+        return res
 
     def clear(self) -> None:
         """Drop everything in the window.
 
         Typical use: after you emit a FINAL on FLUSH/END for an utterance.
         """
-        self.buffer.clear()
+        self._write = 0
+        self._filled = 0
+
+    def reset(self) -> None:
+        """Restore the window to its freshly constructed state.
+
+        For pooled reuse across streams: beyond `clear`, zeroes the
+        ever-seen sample counter and forgets the append specialization, so
+        a recycled window neither reports the previous stream's totals nor
+        assumes its frame size.
+        """
+        self.clear()
+        self._total_samples = 0
+        self._append_impl = self._append_general
+        self._seen_size = -1
+        self._seen_count = 0
 
     # ---------------------------------------------------------------------
     # Convenience metrics / cadence helpers
@@ -157,10 +503,178 @@ class AudioSlidingWindow:
     @property
     def current_samples(self) -> int:
         """How many samples are currently stored (<= max_samples)."""
-        return len(self.buffer)
+        return self._filled
 
     @property
     def current_duration_ms(self) -> int:
         """Approx duration (ms) currently held in the window."""
-        return (1000 * len(self.buffer)) // self.sample_rate_hz
+        return self._filled // self._spms
+
+
+@functools.lru_cache(maxsize=None)
+def _make_window_class(spms: int) -> type:
+    """Build (once per rate) a window subclass specialized for `spms`.
+
+    For power-of-two samples-per-millisecond values the ms<->samples
+    conversions on every read become shifts by a closure-bound constant
+    instead of a multiply/divide through `self._spms`. Behavior is
+    otherwise identical; `AudioSlidingWindow.__new__` dispatches here so
+    callers keep constructing the base class.
+    """
+    shift = spms.bit_length() - 1
 
+    class _ShiftWindow(AudioSlidingWindow):
+        __slots__ = ()
+
+        def tail_ms(
+            self,
+            ms: Optional[int] = None,
+            *,
+            as_float: bool = False,
+            out: Optional[np.ndarray] = None,
+            copy: bool = False,
+        ) -> np.ndarray:
+            """Shift-specialized `tail_ms`; see `AudioSlidingWindow.tail_ms`."""
+            if ms is None:
+                ms = self.default_tail_ms
+            n_samples = int(ms) << shift
+            if n_samples <= 0 or n_samples >= self._filled:
+                n_samples = self._filled
+            return self._read(n_samples, as_float, out, copy)
+
+        @property
+        def current_duration_ms(self) -> int:
+            """Approx duration (ms) currently held in the window."""
+            return self._filled >> shift
+
+    _ShiftWindow.__name__ = f"AudioSlidingWindow{spms}kMono"
+    _ShiftWindow.__qualname__ = _ShiftWindow.__name__
+    return _ShiftWindow
+
+
+# The overwhelmingly common deployment rate, specialized at import time.
+AudioSlidingWindow16kMono = _make_window_class(16)
+
+
+class PcmByteSlidingWindow:
+    """Bytes-in, bytes-out sibling of `AudioSlidingWindow` — no NumPy on append.
+
+    For consumers that only forward raw PCM16 onward (e.g. into a C ASR
+    library), the int16 reinterpretation NumPy does on every append is pure
+    overhead. This ring stores samples in a plain `bytearray` and appends via
+    `memoryview` slice assignment — a single C-level memcpy per slice, no
+    array objects created. Reads still come back as NumPy views (or raw
+    bytes) for callers that want them.
+
+    Same window semantics as `AudioSlidingWindow`: only the newest
+    `max_samples` survive, reads are read-only and alias window-owned memory.
+    The physical size here is exactly `max_samples` (no power-of-two
+    rounding) since the wrap arithmetic is a compare, not a mask.
+    """
+
+    __slots__ = (
+        "window_size_ms",
+        "sample_rate_hz",
+        "max_samples",
+        "_raw",
+        "_mv",
+        "_unwrap",
+        "_write",
+        "_filled",
+        "_total_samples",
+        "_spms",
+    )
+
+    def __init__(self, window_size_ms: int, sample_rate_hz: int = 16000) -> None:
+        assert window_size_ms > 0, "window_size_ms must be > 0"
+        assert sample_rate_hz > 0, "sample_rate_hz must be > 0"
+        assert sample_rate_hz % 1000 == 0, "sample_rate_hz must be a multiple of 1000"
+
+        self.window_size_ms = int(window_size_ms)
+        self.sample_rate_hz = int(sample_rate_hz)
+        self._spms = self.sample_rate_hz // 1000
+        self.max_samples = self._spms * self.window_size_ms
+
+        self._raw = bytearray(self.max_samples * 2)
+        self._mv = memoryview(self._raw).cast("h")
+        self._unwrap = bytearray(self.max_samples * 2)
+        self._write = 0
+        self._filled = 0
+        self._total_samples = 0
+
+    def append(self, pcm16_le: "bytes | bytearray | memoryview") -> int:
+        """Append a PCM16 little-endian mono frame; returns samples appended.
+
+        cast('h') is native order, i.e. little-endian on every host we
+        deploy to, so the reinterpret is free.
+        """
+        src = memoryview(pcm16_le).cast("h")
+        n = len(src)
+        self._total_samples += n
+        if n == 0:
+            return 0
+
+        cap = self.max_samples
+        if n >= cap:
+            self._mv[:] = src[n - cap:]
+            self._write = 0
+            self._filled = cap
+            return n
+
+        end = self._write + n
+        if end <= cap:
+            self._mv[self._write:end] = src
+            self._write = end if end < cap else 0
+        else:
+            k = cap - self._write
+            self._mv[self._write:] = src[:k]
+            self._mv[: n - k] = src[k:]
+            self._write = n - k
+        self._filled = min(cap, self._filled + n)
+        return n
+
+    def _last(self, n: int) -> np.ndarray:
+        """Newest `n` samples as a read-only int16 array (view when possible)."""
+        start = self._write - n
+        if start >= 0:
+            out = np.frombuffer(self._raw, dtype=np.int16, count=n, offset=start * 2)
+        else:
+            head = -start  # samples sitting at the end of the physical buffer
+            umv = memoryview(self._unwrap).cast("h")
+            umv[:head] = self._mv[self.max_samples + start:]
+            umv[head:n] = self._mv[: self._write]
+            out = np.frombuffer(self._unwrap, dtype=np.int16, count=n)
+        out.flags.writeable = False
+        return out
+
+    def full(self) -> np.ndarray:
+        """All samples currently in the window as a read-only int16 array."""
+        return self._last(self._filled)
+
+    def full_bytes(self) -> memoryview:
+        """All samples currently in the window as raw little-endian bytes.
+
+        Read-only memoryview over window-owned memory; hand it straight to a
+        C consumer, or `bytes(...)` it for ownership.
+        """
+        return memoryview(self._last(self._filled))
+
+    def clear(self) -> None:
+        """Drop everything in the window."""
+        self._write = 0
+        self._filled = 0
+
+    @property
+    def total_samples(self) -> int:
+        """How many samples were ever appended to this window (monotonic)."""
+        return self._total_samples
+
+    @property
+    def current_samples(self) -> int:
+        """How many samples are currently stored (<= max_samples)."""
+        return self._filled
+
+    @property
+    def current_duration_ms(self) -> int:
+        """Approx duration (ms) currently held in the window."""
+        return self._filled // self._spms
@@ -1,5 +1,7 @@
 """ASR engine using Whisper model."""
 import math
+
+import numpy as np
 from faster_whisper import WhisperModel
 
 DEFAULT_MODEL = "small.en"
@@ -28,7 +30,34 @@ class AsrEngine:
             List of segment dictionaries with transcription results
         """
         segments, info = self._model.transcribe(audio_path, language="en", word_timestamps=False)
+        return self._collect(segments, info)
+
+    def recognize_f32(self, audio_f32: np.ndarray, sample_rate_hz: int = 16000):
+        """Transcribe in-memory float32 samples in [-1, 1] (mono).
+
+        Feeding the array straight to faster-whisper skips the WAV/tempfile
+        detour — and the ffmpeg decode it triggers — that the path-based
+        `recognize` pays. This is the entry point for the streaming service,
+        which already holds PCM in memory.
+
+        Args:
+            audio_f32: 1-D float32 samples in [-1, 1]
+            sample_rate_hz: Must be 16000; faster-whisper expects 16 kHz input
+
+        Returns:
+            List of segment dictionaries with transcription results
+        """
+        assert sample_rate_hz == 16000, "faster-whisper expects 16 kHz input"
+        if audio_f32.dtype != np.float32 or not audio_f32.flags.c_contiguous:
+            # Guard against float64 creep (e.g. astype(float) upstream):
+            # CTranslate2 wants contiguous float32, and anything wider just
+            # doubles the bytes moved for no precision gain.
+            audio_f32 = np.ascontiguousarray(audio_f32, dtype=np.float32)
+        segments, info = self._model.transcribe(audio_f32, language="en", word_timestamps=False)
+        return self._collect(segments, info)
 
+    @staticmethod
+    def _collect(segments, info):
         result = []
         for i, seg in enumerate(segments, start=1):
             result.append({
@@ -19,9 +19,12 @@ Prereqs:
 """
 from __future__ import annotations
 import asyncio
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 import contextlib
+import os
+import queue
 
 import numpy as np
 from grpc import aio
@@ -33,6 +36,23 @@ from core.sliding_window import AudioSlidingWindow
 
 SAMPLE_RATE = 16000
 
+# Windows (ring + scratch buffers, ~a few hundred KB each) are reused across
+# streams instead of reallocated per RPC: under many concurrent streams that
+# keeps the big buffers at stable addresses and off the allocator entirely.
+_WINDOW_POOL: queue.SimpleQueue[AudioSlidingWindow] = queue.SimpleQueue()
+
+
+def _acquire_window() -> AudioSlidingWindow:
+    try:
+        return _WINDOW_POOL.get_nowait()
+    except queue.Empty:
+        return AudioSlidingWindow(window_size_ms=3000, sample_rate_hz=SAMPLE_RATE)
+
+
+def _release_window(win: AudioSlidingWindow) -> None:
+    win.reset()
+    _WINDOW_POOL.put(win)
+
 
 # ----------------------------- small helpers ---------------------------------
 class Ev(Enum):
@@ -40,74 +60,178 @@ class Ev(Enum):
     CONTROL = auto()
 
 
-@dataclass
 class Event:
     """
     Event is a single event in the event queue.
+
+    Plain mutable class so each stream can recycle its events through a small
+    pool instead of allocating one per inbound frame.
     """
-    kind: Ev  # AUDIO or CONTROL
-    data: bytes | None = None  # for AUDIO
-    ctrl: pb.ControlType | None = None  # for CONTROL
-    utt_id: str = ""  # Utterance ID
+    __slots__ = ("kind", "data", "ctrl", "utt")
+
+    def __init__(
+        self,
+        kind: Ev = Ev.AUDIO,
+        data: bytes | memoryview | None = None,  # for AUDIO (zero-copy view)
+        ctrl: pb.ControlType | None = None,  # for CONTROL
+        utt: str = "",  # Utterance ID
+    ) -> None:
+        self.kind = kind
+        self.data = data
+        self.ctrl = ctrl
+        self.utt = utt
+
+
+# Per-stream Event pool size (see StreamingRecognize).
+_EVENT_POOL_SIZE = 64
+
+
+def _checkout(
+    pool: deque[Event],
+    kind: Ev,
+    data: bytes | memoryview | None = None,
+    ctrl: pb.ControlType | None = None,
+    utt: str = "",
+) -> Event:
+    """Check an Event out of `pool` (allocating if it is empty) and fill it."""
+    try:
+        ev = pool.popleft()
+    except IndexError:
+        ev = Event()
+    ev.kind, ev.data, ev.ctrl, ev.utt = kind, data, ctrl, utt
+    return ev
+
+
+def _checkin(pool: deque[Event], ev: Event) -> None:
+    """Return an Event to `pool`, dropping its frame reference promptly."""
+    ev.data = None
+    if len(pool) < _EVENT_POOL_SIZE:
+        pool.append(ev)
+
+
+async def _put_audio(q: asyncio.Queue[Event], pool: deque[Event], ev: Event) -> None:
+    """Enqueue an AUDIO event with drop-oldest backpressure.
+
+    Never lets a slow consumer stall the gRPC read side: the oldest AUDIO is
+    discarded (recycled into `pool`) to make room; controls are kept and we
+    wait for space instead.
+    """
+    try:
+        q.put_nowait(ev)
+        return
+    except asyncio.QueueFull:
+        pass
+    # Peek the head (no await between peek and pop, so it cannot move): only
+    # AUDIO is droppable. A control at the head stays exactly where it is —
+    # popping and re-putting it would reorder it behind audio that arrived
+    # after it — so we wait for room instead.
+    if q._queue[0].kind is Ev.AUDIO:
+        _checkin(pool, q.get_nowait())
+        q.put_nowait(ev)
+    else:
+        await q.put(ev)
+
+
+async def _read_requests(request_iterator, q: asyncio.Queue[Event], pool: deque[Event]) -> None:
+    """Pump inbound stream messages into `q` as pooled Events, in order.
+
+    Always enqueues a final END control — on client disconnect included — so
+    the consumer loop finalizes exactly once.
+    """
+    current_utt = ""
+    try:
+        async for req in request_iterator:                 # receive ONE message at a time
+            if not current_utt and req.utterance_id:
+                # capture first seen utterance id
+                current_utt = req.utterance_id
+            if req.HasField("audio"):
+                # memoryview keeps the protobuf-owned bytes alive without an
+                # extra per-frame copy; the window's np.frombuffer reads it
+                # via the buffer protocol.
+                frame = memoryview(req.audio.data)
+                await _put_audio(q, pool, _checkout(pool, Ev.AUDIO, data=frame, utt=current_utt))
+            elif req.HasField("control"):
+                ctrl = req.control.type
+                await q.put(_checkout(pool, Ev.CONTROL, ctrl=ctrl, utt=current_utt))
+    finally:
+        end = pb.ControlType.END
+        await q.put(_checkout(pool, Ev.CONTROL, ctrl=end, utt=current_utt))
 
 
 class AsrService(pb_grpc.AsrServicer):
+    def __init__(self, engine=None, max_workers: int | None = None):
+        # One engine (WhisperModel) shared by every stream — CTranslate2 is
+        # thread-safe and releases the GIL during inference — with decodes
+        # pushed onto a bounded thread pool so the event loop keeps draining
+        # the other streams while one of them is decoding.
+        self.engine = engine
+        self._infer_pool = ThreadPoolExecutor(max_workers=max_workers or os.cpu_count())
+
+    async def _decode_f32(self, audio_f32) -> str:
+        """Run blocking inference off the event loop and join the segments."""
+        if self.engine is None or audio_f32.size == 0:
+            return ""
+        loop = asyncio.get_running_loop()
+        segments = await loop.run_in_executor(
+            self._infer_pool, lambda: self.engine.recognize_f32(audio_f32, SAMPLE_RATE)
+        )
+        return " ".join(seg["text"] for seg in segments).strip()
+
     async def StreamingRecognize(self, request_iterator, context: aio.ServicerContext):
         q: asyncio.Queue[Event] = asyncio.Queue(maxsize=512)  # single FIFO preserves order
-        win = AudioSlidingWindow(window_size_ms=3000, sample_rate_hz=SAMPLE_RATE)
-        current_utt = ""
-
-        async def reader():
-            try:
-                async for req in request_iterator:                 # receive ONE message at a time
-                    if not current_utt and req.utterance_id:
-                        # capture first seen utterance id
-                        nonlocal current_utt
-                        current_utt = req.utterance_id
-                    if req.HasField("audio"):
-                        await q.put(Event(Ev.AUDIO, data=req.audio.data, utt=current_utt))
-                    elif req.HasField("control"):
-                        await q.put(Event(Ev.CONTROL, ctrl=req.control.type, utt=current_utt))
-            finally:
-                # If client disconnects, finalize once
-                await q.put(Event(Ev.CONTROL, ctrl=pb.ControlType.END, utt=current_utt))
-
-        reader_task = asyncio.create_task(reader())
+        win = _acquire_window()
+
+        # Per-stream pool of recycled Event wrappers: the reader checks one
+        # out per message, the consumer loop checks it back in after use.
+        pool: deque[Event] = deque(Event() for _ in range(_EVENT_POOL_SIZE))
+
+        reader_task = asyncio.create_task(_read_requests(request_iterator, q, pool))
 
         try:
             while True:
                 ev = await q.get()                              # wait for next enqueued event
-                if ev.kind is Ev.AUDIO and ev.data:
-                    win.append(ev.data)                         # update rolling window
+                kind, data, ctrl, utt = ev.kind, ev.data, ev.ctrl, ev.utt
+                _checkin(pool, ev)
+                if kind is Ev.AUDIO and data:
+                    win.append(data)                            # update rolling window
                     continue                                    # no response yet (no partials)
 
                 # CONTROL
-                if ev.ctrl == pb.ControlType.FLUSH:
-                    text = win.full(as_float=True).tobytes().decode("utf-8")
+                if ctrl == pb.ControlType.FLUSH:
+                    # Decode through the engine (off the event loop); the old
+                    # code tried to UTF-8-decode the raw float32 audio bytes,
+                    # copying the whole window just to (almost always) fail.
+                    # copy=True hands the executor an owned array: if the RPC
+                    # is cancelled mid-decode, the window is released (and may
+                    # be reacquired by another stream) while the executor
+                    # thread is still reading — it must not alias the pooled
+                    # scratch/ring.
+                    text = await self._decode_f32(win.full(as_float=True, copy=True))
                     # FINAL
                     yield pb.StreamingRecognizeResponse(
-                        utterance_id=ev.utt,
+                        utterance_id=utt,
                         type=pb.ResponseType.FINAL,
                         final_transcript=pb.Transcript(text=text),
                     )
                     # ACK
                     yield pb.StreamingRecognizeResponse(
-                        utterance_id=ev.utt,
+                        utterance_id=utt,
                         type=pb.ResponseType.CONTROL_ACK,
                         control_ack=pb.ControlAck(type=pb.ControlType.FLUSH, message="flushed"),
                     )
                     win.clear()
 
-                elif ev.ctrl == pb.ControlType.END:
-                    text = await decode_stub_f32(win.full(as_float=True))
+                elif ctrl == pb.ControlType.END:
+                    # copy=True for the same cancellation-safety reason as FLUSH.
+                    text = await self._decode_f32(win.full(as_float=True, copy=True))
                     if text:
                         yield pb.StreamingRecognizeResponse(
-                            utterance_id=ev.utt,
+                            utterance_id=utt,
                             type=pb.ResponseType.FINAL,
                             final_transcript=pb.Transcript(text=text),
                         )
                     yield pb.StreamingRecognizeResponse(
-                        utterance_id=ev.utt,
+                        utterance_id=utt,
                         type=pb.ResponseType.CONTROL_ACK,
                         control_ack=pb.ControlAck(type=pb.ControlType.END, message="ended"),
                     )
@@ -116,12 +240,13 @@ class AsrService(pb_grpc.AsrServicer):
                 else:
                     # optional ACK for other controls (noop)
                     yield pb.StreamingRecognizeResponse(
-                        utterance_id=ev.utt,
+                        utterance_id=utt,
                         type=pb.ResponseType.CONTROL_ACK,
-                        control_ack=pb.ControlAck(type=ev.ctrl or 0, message="noop"),
+                        control_ack=pb.ControlAck(type=ctrl or 0, message="noop"),
                     )
         finally:
             reader_task.cancel()
             with contextlib.suppress(Exception):
                 await reader_task
+            _release_window(win)
 
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# The asr service resolves intra-service imports (e.g. `core.sliding_window`)
+# from its own root, mirroring pyrightconfig's executionEnvironments entry.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "asr"))
@@ -1,16 +1,27 @@
+import functools
 import math
+
 import numpy as np
 
-from services.asr.core.sliding_window import AudioSlidingWindow
+from services.asr.core.sliding_window import (
+    AudioSlidingWindow,
+    AudioSlidingWindow16kMono,
+    PcmByteSlidingWindow,
+)
 
 SR = 16000  # default sample rate used in tests
 SR_MS = SR // 1000  # samples per millisecond
 
 
+@functools.lru_cache(maxsize=256)
+def _pcm16_block(value: int, ms: int, sr: int = SR) -> bytes:
+    """Build (and cache) a constant-valued PCM16 block of `ms` milliseconds."""
+    return np.full(sr * ms // 1000, value, dtype=np.int16).tobytes()
+
+
 def pcm16_value_ms_repeat(value: int, ms: int) -> bytes:
     """Helper to repeat a value for ms milliseconds."""
-    n = SR_MS * ms
-    return np.full(n, value, dtype=np.int16).tobytes()
+    return _pcm16_block(value, ms)
 
 
 def test_init_defaults():
@@ -80,9 +91,152 @@ def test_rolling_eviction_at_capacity():
     assert win.total_samples == SR_MS * 160
 
 
+def test_wrap_preserves_sample_order():
+    win = AudioSlidingWindow(window_size_ms=100, sample_rate_hz=SR)
+    # Append an increasing ramp in uneven frames so the ring wraps mid-frame.
+    ramp = np.arange(SR_MS * 250, dtype=np.int16)
+    for start in range(0, ramp.size, 528):
+        win.append(ramp[start:start + 528].tobytes())
+    full = win.full()
+    assert full.size == SR_MS * 100
+    np.testing.assert_array_equal(full, ramp[-SR_MS * 100:])
+    tail = win.tail_ms(10)
+    np.testing.assert_array_equal(tail, ramp[-SR_MS * 10:])
+
+
+def test_append_specialization_stays_correct():
+    win = AudioSlidingWindow(window_size_ms=100, sample_rate_hz=SR)
+    ramp = np.arange(SR_MS * 400, dtype=np.int16)
+    frame = SR_MS * 5  # 80 samples, enough repeats to trigger specialization
+    for start in range(0, ramp.size, frame):
+        win.append(ramp[start:start + frame].tobytes())
+    assert win._append_impl is not win._append_general  # specialized
+    np.testing.assert_array_equal(win.full(), ramp[-SR_MS * 100:])
+
+    # A differently sized frame falls back to the general path and still lands.
+    win.append(np.full(3, 7, dtype=np.int16).tobytes())
+    assert win._append_impl == win._append_general
+    np.testing.assert_array_equal(win.full()[-3:], [7, 7, 7])
+
+
+def test_track_float_mirror_matches_conversion():
+    win = AudioSlidingWindow(window_size_ms=100, sample_rate_hz=SR, track_float=True)
+    ramp = np.arange(SR_MS * 250, dtype=np.int16)  # wraps the ring
+    for start in range(0, ramp.size, 528):
+        win.append(ramp[start:start + 528].tobytes())
+    f = win.full(as_float=True)
+    assert f.dtype == np.float32
+    expected = ramp[-SR_MS * 100:].astype(np.float32) / 32768.0
+    np.testing.assert_allclose(f, expected, rtol=0, atol=1e-7)
+
+
 def test_as_float_scaling():
     win = AudioSlidingWindow(window_size_ms=1000, sample_rate_hz=SR)
     win.append(pcm16_value_ms_repeat(-32768, 100))
     f = win.full(as_float=True)
     assert f.dtype == np.float32
     assert math.isclose(float(f[0]), -1.0, rel_tol=0, abs_tol=1e-6)
+
+
+def test_append_accepts_int16_ndarray():
+    win = AudioSlidingWindow(window_size_ms=100, sample_rate_hz=SR)
+    samples = np.arange(SR_MS * 20, dtype=np.int16)
+    assert win.append(samples) == samples.size
+    np.testing.assert_array_equal(win.full(), samples)
+
+
+def test_reads_are_readonly_views_when_contiguous():
+    win = AudioSlidingWindow(window_size_ms=100, sample_rate_hz=SR)
+    win.append(pcm16_value_ms_repeat(5, 50))
+    full = win.full()
+    assert full.base is win._buf  # zero-copy while the ring has not wrapped
+    assert not full.flags.writeable
+    with np.testing.assert_raises(ValueError):
+        full[0] = 1
+
+
+def test_short_tail_after_wrap_is_zero_copy():
+    win = AudioSlidingWindow(window_size_ms=100, sample_rate_hz=SR)
+    ramp = np.arange(SR_MS * 250, dtype=np.int16)
+    for start in range(0, ramp.size, 528):
+        win.append(ramp[start:start + 528].tobytes())
+    # The ring has wrapped, but a short lookback that does not cross the
+    # physical boundary must still be a plain slice, not an unwrap copy.
+    tail = win.tail_ms(10)
+    assert tail.base is win._buf
+    np.testing.assert_array_equal(tail, ramp[-SR_MS * 10:])
+
+
+def test_copy_kwarg_returns_owned_writable_array():
+    win = AudioSlidingWindow(window_size_ms=100, sample_rate_hz=SR)
+    win.append(pcm16_value_ms_repeat(5, 50))
+    owned = win.full(copy=True)
+    assert owned.base is None
+    assert owned.flags.writeable
+    owned[:] = 0  # must not touch the ring
+    np.testing.assert_array_equal(win.full(), np.full(SR_MS * 50, 5, dtype=np.int16))
+
+
+def test_16k_construction_dispatches_to_specialized_class():
+    win = AudioSlidingWindow(window_size_ms=1000, sample_rate_hz=SR)
+    assert type(win) is AudioSlidingWindow16kMono
+    win.append(pcm16_value_ms_repeat(7, 120))
+    assert win.current_duration_ms == 120
+    assert win.tail_ms(40).size == SR_MS * 40
+    # Non power-of-two rates stay on the general class.
+    assert type(AudioSlidingWindow(window_size_ms=1000, sample_rate_hz=48000)) is AudioSlidingWindow
+
+
+def test_byte_window_matches_numpy_window():
+    ref = AudioSlidingWindow(window_size_ms=100, sample_rate_hz=SR)
+    byt = PcmByteSlidingWindow(window_size_ms=100, sample_rate_hz=SR)
+    ramp = np.arange(SR_MS * 250, dtype=np.int16)  # wraps both rings
+    for start in range(0, ramp.size, 528):
+        frame = ramp[start:start + 528].tobytes()
+        assert byt.append(frame) == ref.append(frame)
+    np.testing.assert_array_equal(byt.full(), ref.full())
+    assert byt.total_samples == ref.total_samples
+    assert byt.current_duration_ms == ref.current_duration_ms
+
+
+def test_byte_window_bytes_export():
+    byt = PcmByteSlidingWindow(window_size_ms=100, sample_rate_hz=SR)
+    byt.append(pcm16_value_ms_repeat(3, 20))
+    raw = byt.full_bytes()
+    assert bytes(raw) == pcm16_value_ms_repeat(3, 20)
+    assert raw.readonly
+
+
+def test_bf16_export_approximates_float_window():
+    win = AudioSlidingWindow(window_size_ms=100, sample_rate_hz=SR)
+    win.append(np.arange(-800, 800, dtype=np.int16))
+    bits = win.full(as_bf16=True)
+    assert bits.dtype == np.uint16
+    # bf16 keeps sign+exponent and 7 mantissa bits: widening back to float32
+    # must agree with the float export to bf16 precision (~2^-8 relative).
+    widened = (bits.astype(np.uint32) << 16).view(np.float32)
+    np.testing.assert_allclose(widened, win.full(as_float=True), rtol=0, atol=2e-4)
+
+
+def test_reset_restores_fresh_state():
+    win = AudioSlidingWindow(window_size_ms=100, sample_rate_hz=SR)
+    frame = pcm16_value_ms_repeat(1, 5)
+    for _ in range(40):
+        win.append(frame)
+    assert win._append_impl is not win._append_general  # specialized
+    win.reset()
+    # A recycled window must not report the previous stream's totals or
+    # assume its frame size.
+    assert win.total_samples == 0
+    assert win.current_samples == 0
+    assert win._append_impl == win._append_general
+
+
+def test_symmetric_float_scaling():
+    win = AudioSlidingWindow(window_size_ms=1000, sample_rate_hz=SR, symmetric_float=True)
+    win.append(pcm16_value_ms_repeat(32767, 10))
+    win.append(pcm16_value_ms_repeat(-32768, 10))
+    f = win.full(as_float=True)
+    # +32767 maps to exactly +1.0; -32768 saturates to -1.0.
+    assert math.isclose(float(f[0]), 1.0, rel_tol=0, abs_tol=1e-6)
+    assert float(f[-1]) == -1.0
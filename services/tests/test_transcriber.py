@@ -0,0 +1,68 @@
+import asyncio
+
+from core.transcriber import Ev, Transcriber, _DurationEngine, _stitch
+
+
+def _stitch_greedy(prev: str, new: str) -> str:
+    """Reference implementation: the original O(n^2) endswith scan."""
+    if not prev:
+        return new
+    if not new:
+        return prev
+    max_k = min(len(prev), len(new))
+    for k in range(max_k, 0, -1):
+        if prev.endswith(new[:k]):
+            return prev + new[k:]
+    return prev + new
+
+
+def test_stitch_overlap():
+    assert _stitch("turn on the ki", "the kitchen lights") == "turn on the kitchen lights"
+
+
+def test_stitch_empty_and_disjoint():
+    assert _stitch("", "hello") == "hello"
+    assert _stitch("hello", "") == "hello"
+    assert _stitch("foo", "bar") == "foobar"
+    assert _stitch("abc", "abc") == "abc"
+
+
+def test_feed_audio_drops_oldest_when_full():
+    async def scenario():
+        tr = Transcriber(_DurationEngine())
+        tr.q = asyncio.Queue(maxsize=2)
+        await tr.feed_audio(b"\x01\x00")
+        await tr.feed_audio(b"\x02\x00")
+        await tr.feed_audio(b"\x03\x00")  # queue full: frame 1 is dropped
+        assert tr.q.qsize() == 2
+        assert tr.q.get_nowait().data == b"\x02\x00"
+        assert tr.q.get_nowait().data == b"\x03\x00"
+
+    asyncio.run(scenario())
+
+
+def test_feed_audio_never_reorders_controls():
+    async def scenario():
+        tr = Transcriber(_DurationEngine())
+        tr.q = asyncio.Queue(maxsize=2)
+        await tr.flush()
+        await tr.feed_audio(b"\x01\x00")
+        # Queue full with a control at the head: the frame must wait for
+        # room behind it, not leapfrog the FLUSH.
+        blocked = asyncio.create_task(tr.feed_audio(b"\x02\x00"))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+        assert tr.q.get_nowait().kind is Ev.FLUSH
+        assert (await tr.q.get()).data == b"\x01\x00"
+        await blocked
+        assert (await tr.q.get()).data == b"\x02\x00"
+
+    asyncio.run(scenario())
+
+
+def test_stitch_matches_greedy_reference():
+    # Small alphabet maximizes accidental overlaps.
+    words = ["", "a", "ab", "ba", "aba", "abab", "baba", "aabb", "abba"]
+    for prev in words:
+        for new in words:
+            assert _stitch(prev, new) == _stitch_greedy(prev, new), (prev, new)